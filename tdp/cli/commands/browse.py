@@ -277,10 +277,12 @@ def _format_component_version_log(
 
     def custom_format(key, value):
         if key == "version":
-            return str(value[:7])
+            return str(component_version_log.short_version)
         else:
             return str(value)
 
     return {
-        key: custom_format(key, getattr(component_version_log, key)) for key in headers
+        key: custom_format(key, getattr(component_version_log, key))
+        for key in headers
+        if key != "short_version"
     }
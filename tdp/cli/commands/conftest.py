@@ -2,15 +2,16 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from pathlib import Path
+from typing import Tuple
 
 import pytest
+from click.testing import CliRunner
 
+from tdp.cli.commands.init import init
 from tdp.conftest import generate_collection
 
 
-@pytest.fixture
-def collection_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
-    collection_path = tmp_path_factory.mktemp("collection")
+def _generate_service_collection(collection_path: Path) -> None:
     dag_service_operations = {
         "service": [
             {"name": "service_install"},
@@ -25,6 +26,12 @@ def collection_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
         },
     }
     generate_collection(collection_path, dag_service_operations, service_vars)
+
+
+@pytest.fixture
+def collection_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    collection_path = tmp_path_factory.mktemp("collection")
+    _generate_service_collection(collection_path)
     return collection_path
 
 
@@ -38,6 +45,32 @@ def database_dsn_path(tmp_path: Path) -> str:
     return "sqlite:///" + str(tmp_path / "sqlite.db")
 
 
+@pytest.fixture(scope="session")
+def initialized_db(tmp_path_factory: pytest.TempPathFactory) -> Tuple[Path, str]:
+    """Collection path and DSN of a database initialized once with `tdp init`.
+
+    The database is shared by the whole test session: consumers must not rely on
+    its content beyond the initialization (e.g. no planned deployment), as other
+    tests may have written to it.
+    """
+    collection_path = tmp_path_factory.mktemp("collection")
+    _generate_service_collection(collection_path)
+    database_dsn = "sqlite:///" + str(tmp_path_factory.mktemp("database") / "sqlite.db")
+    result = CliRunner().invoke(
+        init,
+        [
+            "--collection-path",
+            collection_path,
+            "--database-dsn",
+            database_dsn,
+            "--vars",
+            str(tmp_path_factory.mktemp("tdp_vars")),
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    return collection_path, database_dsn
+
+
 @pytest.fixture
 def vars(tmp_path_factory: pytest.TempPathFactory) -> Path:
     return tmp_path_factory.mktemp("collection")
@@ -15,7 +15,7 @@ from tdp.cli.utils import (
     validate,
     vars,
 )
-from tdp.core.deployment import DeploymentRunner, Executor
+from tdp.core.deployment import AnsibleExecutor, DeploymentRunner
 from tdp.core.models import DeploymentStateEnum
 from tdp.core.variables import ClusterVariables
 
@@ -51,7 +51,7 @@ def deploy(
         stale_components = get_stale_components(session)
         deployment_runner = DeploymentRunner(
             collections,
-            Executor(
+            AnsibleExecutor(
                 run_directory=run_directory.absolute() if run_directory else None,
                 dry=dry or mock_deploy,
             ),
@@ -3,12 +3,13 @@
 
 
 import click
+from sqlalchemy import delete, update
 
 from tdp.cli.queries import get_planned_deployment_log
 from tdp.cli.session import get_session
 from tdp.cli.utils import collections, database_dsn
-from tdp.core.dag import Dag
-from tdp.core.models import DeploymentLog, FilterTypeEnum
+from tdp.core.dag import get_dag
+from tdp.core.models import DeploymentLog, FilterTypeEnum, OperationLog
 
 
 def _validate_filtertype(ctx, param, value):
@@ -65,22 +66,19 @@ def dag(
     collections,
     database_dsn,
 ):
-    dag = Dag(collections)
-    set_nodes = set()
-    if sources:
-        sources = sources.split(",")
-        set_nodes.update(sources)
-    if targets:
-        targets = targets.split(",")
-        set_nodes.update(targets)
-    set_difference = set_nodes.difference(dag.operations)
+    dag = get_dag(collections)
+    # Nodes are kept as tuples so that they can be used as cache keys
+    sources = tuple(sources.split(",")) if sources else ()
+    targets = tuple(targets.split(",")) if targets else ()
+    set_nodes = set(sources).union(targets)
+    set_difference = set_nodes - dag.operations_set
     if set_difference:
         raise click.BadParameter(f"{set_difference} are not valid nodes.")
 
     if sources:
-        click.echo(f"Creating a deployment plan from: {sources}")
+        click.echo(f"Creating a deployment plan from: {list(sources)}")
     elif targets:
-        click.echo(f"Creating a deployment plan to: {targets}")
+        click.echo(f"Creating a deployment plan to: {list(targets)}")
     else:
         click.echo("Creating a deployment plan for the whole DAG.")
     deployment_log = DeploymentLog.from_dag(
@@ -94,6 +92,28 @@ def dag(
     with get_session(database_dsn, commit_on_exit=True) as session:
         planned_deployment_log = get_planned_deployment_log(session)
         if planned_deployment_log:
+            # Replace the planned deployment in place, without loading its
+            # operations nor checking the identity of each child row
             deployment_log.id = planned_deployment_log.id
-        session.merge(deployment_log)
+            session.execute(
+                delete(OperationLog).where(
+                    OperationLog.deployment_id == deployment_log.id
+                )
+            )
+            session.execute(
+                update(DeploymentLog)
+                .where(DeploymentLog.id == deployment_log.id)
+                .values(
+                    {
+                        column.key: getattr(deployment_log, column.key)
+                        for column in DeploymentLog.__table__.columns
+                        if column.key != "id"
+                    }
+                )
+            )
+            for operation_log in deployment_log.operations:
+                operation_log.deployment_id = deployment_log.id
+            session.bulk_save_objects(deployment_log.operations)
+        else:
+            session.add(deployment_log)
     click.echo("Deployment plan successfully created.")
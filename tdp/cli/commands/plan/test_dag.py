@@ -8,6 +8,8 @@ from click.testing import CliRunner
 
 from tdp.cli.commands.init import init
 from tdp.cli.commands.plan.dag import dag
+from tdp.cli.queries import get_planned_deployment_log
+from tdp.cli.session import get_session
 
 
 def test_tdp_plan_dag(collection_path: Path, database_dsn_path: str, vars: Path):
@@ -22,3 +24,30 @@ def test_tdp_plan_dag(collection_path: Path, database_dsn_path: str, vars: Path)
     assert result.exit_code == 0, result.output
     result = runner.invoke(dag, base_args)
     assert result.exit_code == 0, result.output
+
+
+def test_tdp_plan_dag_replaces_planned_deployment(
+    collection_path: Path, database_dsn_path: str, vars: Path
+):
+    base_args = [
+        "--collection-path",
+        collection_path,
+        "--database-dsn",
+        database_dsn_path,
+    ]
+    runner = CliRunner()
+    result = runner.invoke(init, [*base_args, "--vars", str(vars)])
+    assert result.exit_code == 0, result.output
+    result = runner.invoke(dag, base_args)
+    assert result.exit_code == 0, result.output
+    result = runner.invoke(dag, [*base_args, "--targets", "service_config"])
+    assert result.exit_code == 0, result.output
+
+    with get_session(database_dsn_path) as session:
+        planned_deployment_log = get_planned_deployment_log(session)
+        assert planned_deployment_log.id == 1
+        assert planned_deployment_log.targets == ["service_config"]
+        assert [
+            operation_log.operation
+            for operation_log in planned_deployment_log.operations
+        ] == ["service_install", "service_config"]
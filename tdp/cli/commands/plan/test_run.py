@@ -2,22 +2,21 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from pathlib import Path
+from typing import Tuple
 
 from click.testing import CliRunner
 
-from tdp.cli.commands.init import init
 from tdp.cli.commands.plan.run import run
 
 
-def test_tdp_plan_run(collection_path: Path, database_dsn_path: str, vars: Path):
+def test_tdp_plan_run(initialized_db: Tuple[Path, str]):
+    collection_path, database_dsn = initialized_db
     base_args = [
         "--collection-path",
         collection_path,
         "--database-dsn",
-        database_dsn_path,
+        database_dsn,
     ]
     runner = CliRunner()
-    result = runner.invoke(init, [*base_args, "--vars", str(vars)])
-    assert result.exit_code == 0, result.output
     result = runner.invoke(run, [*base_args, "service_install"])
     assert result.exit_code == 0, result.output
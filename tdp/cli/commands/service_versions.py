@@ -1,6 +1,9 @@
 # Copyright 2022 TOSIT.IO
 # SPDX-License-Identifier: Apache-2.0
 
+import itertools
+from typing import Iterable
+
 import click
 from tabulate import tabulate
 
@@ -20,17 +23,24 @@ from tdp.core.models import ComponentVersionLog
 @database_dsn
 def service_versions(database_dsn):
     with get_session(database_dsn) as session:
-        latest_success_service_version_logs = get_latest_success_component_version_log(
-            session
+        latest_success_service_version_logs = iter(
+            get_latest_success_component_version_log(session).yield_per(200)
         )
-        if any(latest_success_service_version_logs):
+        first_service_version_log = next(latest_success_service_version_logs, None)
+        if first_service_version_log is not None:
             # TODO: refactor so that this not import private method from browse.py
-            _print_component_version_logs(latest_success_service_version_logs)
+            _print_component_version_logs(
+                itertools.chain(
+                    [first_service_version_log], latest_success_service_version_logs
+                )
+            )
         else:
             click.echo("No service has been deployed.")
 
 
-def _print_component_version_logs(component_version_logs: list[ComponentVersionLog]):
+def _print_component_version_logs(
+    component_version_logs: Iterable[ComponentVersionLog],
+):
     component_version_log_headers = ComponentVersionLog.__table__.columns.keys()
 
     click.echo(
@@ -50,7 +50,7 @@ def stale(
             click.echo("Generating the list of stale components.")
             deployed_component_version_logs = get_latest_success_component_version_log(
                 session
-            )
+            ).all()
             stale_components = StaleComponent.generate(
                 dag, cluster_variables, deployed_component_version_logs
             )
@@ -3,11 +3,11 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterable, Optional
 
-from sqlalchemy import and_, desc, func, or_, select, tuple_
+from sqlalchemy import desc, func, select, tuple_
 from sqlalchemy.exc import NoResultFound
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import aliased, joinedload, selectinload
 
 from tdp.core.models import (
     ComponentVersionLog,
@@ -17,6 +17,7 @@ from tdp.core.models import (
 )
 
 if TYPE_CHECKING:
+    from sqlalchemy.engine import ScalarResult
     from sqlalchemy.orm.session import Session
 
 
@@ -34,62 +35,41 @@ def get_stale_components(session: Session) -> list[StaleComponent]:
 
 def get_latest_success_component_version_log(
     session: Session,
-) -> list[ComponentVersionLog]:
+) -> ScalarResult[ComponentVersionLog]:
     """Get the latest success component version.
 
+    Rows are fetched lazily, call `.all()` on the result to get a list or
+    `.yield_per()` to fetch them by batches.
+
     Args:
         session: The database session.
 
     Returns:
         Components with the latest success version. ([id, service_name, component_name, short_version])
     """
-    max_deployment_id_label = f"max_{ComponentVersionLog.deployment_id.name}"
-
-    # Latest success deployment for each service/component pair
-    latest_deployed_component = (
-        session.query(
-            func.max(ComponentVersionLog.deployment_id).label(max_deployment_id_label),
-            ComponentVersionLog.service,
-            ComponentVersionLog.component,
+    # Rank component version logs by deployment for each service/component pair,
+    # rows of the latest deployment (one per host) are ranked first
+    ranked_component_version_log = select(
+        ComponentVersionLog,
+        func.rank()
+        .over(
+            partition_by=[ComponentVersionLog.service, ComponentVersionLog.component],
+            order_by=desc(ComponentVersionLog.deployment_id),
         )
-        .group_by(ComponentVersionLog.service, ComponentVersionLog.component)
-        .subquery()
+        .label("rank"),
+    ).subquery()
+    latest_component_version_log = aliased(
+        ComponentVersionLog, ranked_component_version_log
     )
 
-    return (
-        session.query(ComponentVersionLog)
-        .filter(
-            or_(
-                # Components with the latest success deployment
-                # Filter deployment_id, service and component from the subquery
-                tuple_(
-                    ComponentVersionLog.deployment_id,
-                    ComponentVersionLog.service,
-                    ComponentVersionLog.component,
-                ).in_(select(latest_deployed_component)),
-                # Services with the latest success depoyment (no component)
-                # Filter deployment_id and service from the subquery AND component is null
-                and_(
-                    tuple_(
-                        ComponentVersionLog.deployment_id,
-                        ComponentVersionLog.service,
-                    ).in_(
-                        # Component column is removed from the subquery
-                        select(
-                            latest_deployed_component.c[max_deployment_id_label],
-                            latest_deployed_component.c.service,
-                        )
-                    ),
-                    ComponentVersionLog.component.is_(None),
-                ),
-            )
-        )
+    return session.scalars(
+        select(latest_component_version_log)
+        .where(ranked_component_version_log.c.rank == 1)
         .order_by(
-            desc(ComponentVersionLog.deployment_id),
-            ComponentVersionLog.service,
-            ComponentVersionLog.component,
+            desc(latest_component_version_log.deployment_id),
+            latest_component_version_log.service,
+            latest_component_version_log.component,
         )
-        .all()
     )
 
 
@@ -125,11 +105,16 @@ def get_deployment(session: Session, deployment_id: int) -> DeploymentLog:
         The deployment.
 
     Raises:
-        NoResultFound: If the deployment does not exist."""
-    try:
-        return session.query(DeploymentLog).filter_by(id=deployment_id).one()
-    except NoResultFound as e:
-        raise Exception(f"Deployment id {deployment_id} does not exist.") from e
+        Exception: If the deployment does not exist.
+    """
+    deployment_log = session.get(
+        DeploymentLog,
+        deployment_id,
+        options=[selectinload(DeploymentLog.operations)],
+    )
+    if deployment_log is None:
+        raise Exception(f"Deployment id {deployment_id} does not exist.")
+    return deployment_log
 
 
 def get_last_deployment(session: Session) -> DeploymentLog:
@@ -145,12 +130,13 @@ def get_last_deployment(session: Session) -> DeploymentLog:
         NoResultFound: If there is no deployment.
     """
     try:
-        return (
-            session.query(DeploymentLog)
-            .order_by(DeploymentLog.id.desc())
-            .limit(1)
-            .one()
-        )
+        return session.execute(
+            select(DeploymentLog)
+            .options(selectinload(DeploymentLog.operations))
+            .where(
+                DeploymentLog.id == select(func.max(DeploymentLog.id)).scalar_subquery()
+            )
+        ).scalar_one()
     except NoResultFound as e:
         raise Exception(f"No deployments.") from e
 
@@ -178,18 +164,55 @@ def get_operation_log(
         operation_name: The operation name.
 
     Returns:
-        The operation log.
+        The operation log. When the operation appears several times in the
+        deployment (one per host), the first one in the deployment order.
 
     Raises:
-        NoResultFound: If the operation does not exist.
+        Exception: If the operation does not exist.
     """
-    try:
-        return (
-            session.query(OperationLog)
-            .filter_by(deployment_id=deployment_id, operation=operation_name)
-            .one()
+    operation_log = session.scalar(
+        select(OperationLog)
+        .where(
+            OperationLog.deployment_id == deployment_id,
+            OperationLog.operation == operation_name,
         )
-    except NoResultFound as e:
+        .order_by(OperationLog.operation_order)
+        .limit(1)
+    )
+    if operation_log is None:
         raise Exception(
             f"Operation {operation_name} does not exist in deployment {deployment_id}."
-        ) from e
+        )
+    return operation_log
+
+
+def get_operation_logs(
+    session: Session, operations: Iterable[tuple[int, str]]
+) -> dict[tuple[int, str], OperationLog]:
+    """Get operation logs in a single query.
+
+    Args:
+        session: The database session.
+        operations: Pairs of deployment id and operation name.
+
+    Returns:
+        The operation logs by deployment id and operation name. Pairs which do not
+        exist are missing. When an operation appears several times in a deployment,
+        the first one in the deployment order is returned, as with
+        `get_operation_log`.
+    """
+    operations = list(operations)
+    if not operations:
+        return {}
+    operation_logs = {}
+    for operation_log in session.scalars(
+        select(OperationLog)
+        .where(
+            tuple_(OperationLog.deployment_id, OperationLog.operation).in_(operations)
+        )
+        .order_by(OperationLog.deployment_id, OperationLog.operation_order)
+    ):
+        operation_logs.setdefault(
+            (operation_log.deployment_id, operation_log.operation), operation_log
+        )
+    return operation_logs
@@ -1,14 +1,55 @@
 # Copyright 2022 TOSIT.IO
 # SPDX-License-Identifier: Apache-2.0
 
+import atexit
 from contextlib import contextmanager
 from typing import Iterator
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
 
 from tdp.core.models import init_database
 
+# Engines shared by the sessions of the process, by DSN
+_engines: dict[str, Engine] = {}
+
+
+def get_session_class(database_dsn: str) -> sessionmaker:
+    """Get a session factory bound to an engine shared for a given DSN.
+
+    SQLite engines do not pool connections, other engines keep a pool of
+    connections which are checked before use and recycled after one hour.
+
+    Args:
+        database_dsn: DSN of the database.
+
+    Returns:
+        A SQLAlchemy sessionmaker.
+    """
+    engine = _engines.get(database_dsn)
+    if engine is None:
+        if make_url(database_dsn).get_backend_name() == "sqlite":
+            engine = create_engine(database_dsn, echo=False, poolclass=NullPool)
+        else:
+            engine = create_engine(
+                database_dsn,
+                echo=False,
+                pool_pre_ping=True,
+                pool_size=5,
+                pool_recycle=3600,
+            )
+        _engines[database_dsn] = engine
+    return sessionmaker(bind=engine)
+
+
+@atexit.register
+def _dispose_engines() -> None:
+    """Dispose the shared engines, closing their pooled connections."""
+    for engine in _engines.values():
+        engine.dispose()
+
 
 @contextmanager
 def get_session(database_dsn: str, commit_on_exit: bool = False) -> Iterator[Session]:
@@ -21,9 +62,7 @@ def get_session(database_dsn: str, commit_on_exit: bool = False) -> Iterator[Ses
     Yields:
         An instance of a SQLAlchemy session.
     """
-    engine = create_engine(database_dsn, echo=False, future=True)
-    session_maker = sessionmaker(bind=engine)
-    session = session_maker()
+    session = get_session_class(database_dsn)()
 
     try:
         yield session
@@ -0,0 +1,94 @@
+# Copyright 2022 TOSIT.IO
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Iterator
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from tdp.cli.queries import get_operation_log, get_operation_logs
+from tdp.core.models import (
+    DeploymentLog,
+    OperationLog,
+    OperationStateEnum,
+    init_database,
+)
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    init_database(engine)
+    with sessionmaker(bind=engine)() as session:
+        deployment_log = DeploymentLog(id=1)
+        # Operations are expanded by host, the same name appears several times.
+        # They are inserted in reverse order so that ordering is not implicit.
+        for operation_order, operation, host in [
+            (3, "service_config", None),
+            (2, "service_install", "host2"),
+            (1, "service_install", "host1"),
+        ]:
+            deployment_log.operations.append(
+                OperationLog(
+                    operation=operation,
+                    operation_order=operation_order,
+                    host=host,
+                    state=OperationStateEnum.SUCCESS,
+                )
+            )
+        session.add(deployment_log)
+        session.add(
+            DeploymentLog(
+                id=2,
+                operations=[
+                    OperationLog(
+                        operation="service_start",
+                        operation_order=1,
+                        state=OperationStateEnum.SUCCESS,
+                    )
+                ],
+            )
+        )
+        session.commit()
+        yield session
+    engine.dispose()
+
+
+def test_get_operation_log_returns_first_operation(session: Session):
+    operation_log = get_operation_log(session, 1, "service_install")
+
+    assert operation_log.operation_order == 1
+    assert operation_log.host == "host1"
+
+
+def test_get_operation_log_does_not_exist(session: Session):
+    with pytest.raises(Exception, match="does not exist"):
+        get_operation_log(session, 1, "service_start")
+
+
+def test_get_operation_logs(session: Session):
+    operation_logs = get_operation_logs(
+        session,
+        [
+            (1, "service_install"),
+            (1, "service_config"),
+            (2, "service_start"),
+            (2, "service_install"),
+        ],
+    )
+
+    assert set(operation_logs) == {
+        (1, "service_install"),
+        (1, "service_config"),
+        (2, "service_start"),
+    }
+    # Duplicated operation names return the first operation of the deployment
+    assert operation_logs[(1, "service_install")].operation_order == 1
+    assert operation_logs[(1, "service_install")].host == "host1"
+    assert operation_logs[(1, "service_config")].operation_order == 3
+    assert operation_logs[(2, "service_start")].deployment_id == 2
+
+
+def test_get_operation_logs_empty(session: Session):
+    assert get_operation_logs(session, []) == {}
@@ -0,0 +1,22 @@
+# Copyright 2022 TOSIT.IO
+# SPDX-License-Identifier: Apache-2.0
+
+from pathlib import Path
+
+from sqlalchemy.pool import NullPool
+
+from tdp.cli.session import get_session
+
+
+def test_get_session_shares_engine(tmp_path: Path):
+    database_dsn_path = "sqlite:///" + str(tmp_path / "sqlite.db")
+    with get_session(database_dsn_path) as session_1:
+        engine = session_1.get_bind()
+    with get_session(database_dsn_path) as session_2:
+        assert session_2.get_bind() is engine
+
+
+def test_get_session_sqlite_does_not_pool(tmp_path: Path):
+    database_dsn_path = "sqlite:///" + str(tmp_path / "sqlite.db")
+    with get_session(database_dsn_path) as session:
+        assert isinstance(session.get_bind().pool, NullPool)
@@ -6,6 +6,7 @@ from __future__ import annotations
 import logging
 from collections import OrderedDict
 from collections.abc import Mapping
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Iterable
 from typing import Mapping as MappingType
 from typing import Sequence
@@ -49,6 +50,8 @@ class Collections(Mapping):
         self._collections = collections
         self._dag_operations = None
         self._other_operations = None
+        self._operations = None
+        self._revision = 0
         self._init_operations()
 
     def __getitem__(self, key):
@@ -90,8 +93,14 @@ class Collections(Mapping):
     @collections.setter
     def collections(self, collections: "Collections"):
         self._collections = collections
+        self._revision += 1
         self._init_operations()
 
+    @property
+    def revision(self) -> int:
+        """Counter incremented each time the collections are replaced."""
+        return self._revision
+
     @property
     def dag_operations(self) -> MappingType[str, Operation]:
         """Mapping of operation name that are defined in dag files to their Operation instance."""
@@ -105,12 +114,7 @@ class Collections(Mapping):
     @property
     def operations(self) -> MappingType[str, Operation]:
         """Mapping of all operation name to Operation instance."""
-        operations = {}
-        if self._dag_operations:
-            operations.update(self._dag_operations)
-        if self._other_operations:
-            operations.update(self._other_operations)
-        return operations
+        return self._operations
 
     def _init_operations(self):
         self._dag_operations = {}
@@ -188,6 +192,12 @@ class Collections(Mapping):
                     collection_name=collection_name,
                 )
 
+        # Init all Operations, built once as operations are looked up by name
+        # for each planned and run operation
+        self._operations = MappingProxyType(
+            {**self._dag_operations, **self._other_operations}
+        )
+
     def get_service_schema(self, service_name: str) -> dict:
         """Get the service's schema.
 
@@ -12,11 +12,10 @@ or on a subgraph of the DAG.
 
 from __future__ import annotations
 
-import fnmatch
 import functools
 import logging
 import re
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING, Union
 
 import networkx as nx
 
@@ -58,7 +57,9 @@ class Dag:
         """
         self._collections = collections
         self._operations = None
+        self._operations_set = None
         self._graph = None
+        self._operations_names = {}
         self._yaml_files = None
         self._services = None
         self._services_operations = None
@@ -87,6 +88,7 @@ class Dag:
     def operations(self, value: dict[str, Operation]) -> None:
         """Set operations and reset graph, services_operations and services."""
         self._operations = value
+        del self.operations_set
         del self.graph
         del self.services_operations
         del self.services
@@ -95,6 +97,17 @@ class Dag:
     def operations(self) -> None:
         self.operations = None
 
+    @property
+    def operations_set(self) -> frozenset[str]:
+        """Set of DAG operation names."""
+        if self._operations_set is None:
+            self._operations_set = frozenset(self.operations)
+        return self._operations_set
+
+    @operations_set.deleter
+    def operations_set(self) -> None:
+        self._operations_set = None
+
     @property
     def services_operations(self) -> dict[str, list[Operation]]:
         """DAG operations dictionary grouped by service."""
@@ -146,7 +159,9 @@ class Dag:
 
     @graph.setter
     def graph(self, value: nx.DiGraph) -> None:
+        """Set graph and reset cached operations names."""
         self._graph = value
+        self._operations_names = {}
 
     @graph.deleter
     def graph(self) -> None:
@@ -210,6 +225,36 @@ class Dag:
             return self.get_operations_to_nodes(targets, restart)
         return self.get_all_operations(restart)
 
+    def get_operations_names(
+        self,
+        sources: Optional[tuple[str, ...]] = None,
+        targets: Optional[tuple[str, ...]] = None,
+        restart: bool = False,
+        filter_pattern: Optional[re.Pattern] = None,
+    ) -> tuple[str, ...]:
+        """Get the names of the operations returned by `get_operations`.
+
+        Results are cached until the DAG graph changes.
+
+        Args:
+            sources: Nodes from which to get the operations.
+            targets: Nodes to which to get the operations.
+            restart: If True, restart operations are returned instead of start operations.
+            filter_pattern: Pattern the operation names must match.
+
+        Returns:
+            Tuple of operation names sorted topologically.
+        """
+        key = (sources, targets, restart, filter_pattern)
+        if key not in self._operations_names:
+            operations = self.get_operations(sources, targets, restart)
+            if filter_pattern is not None:
+                operations = self.filter_operations_regex(operations, filter_pattern)
+            self._operations_names[key] = tuple(
+                operation.name for operation in operations
+            )
+        return self._operations_names[key]
+
     def get_operations_to_nodes(
         self, nodes: list[str], restart: bool = False
     ) -> list[Operation]:
@@ -238,13 +283,8 @@ class Dag:
         """
         return self.topological_sort(self.graph, restart)
 
-    def filter_operations_glob(
-        self, operations: list[Operation], glob: str
-    ) -> list[Operation]:
-        return list(filter(lambda o: fnmatch.fnmatch(o.name, glob), operations))  # type: ignore
-
     def filter_operations_regex(
-        self, operations: list[Operation], regex: str
+        self, operations: list[Operation], regex: Union[str, re.Pattern]
     ) -> list[Operation]:
         compiled_regex = re.compile(regex)
         return list(filter(lambda o: compiled_regex.match(o.name), operations))  # type: ignore
@@ -341,3 +381,41 @@ class Dag:
                     f"Service '{service}' have these actions {actions} and at least one action is missing from "
                     f"{actions_for_service}"
                 )
+
+
+class _CollectionsKey:
+    """Hashable key identifying a Collections instance at a given revision."""
+
+    def __init__(self, collections: Collections):
+        self.collections = collections
+        self.revision = collections.revision
+
+    def __hash__(self) -> int:
+        return hash((id(self.collections), self.revision))
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, _CollectionsKey)
+            and self.collections is other.collections
+            and self.revision == other.revision
+        )
+
+
+@functools.lru_cache(maxsize=8)
+def _get_dag(collections_key: _CollectionsKey) -> Dag:
+    return Dag(collections_key.collections)
+
+
+def get_dag(collections: Collections) -> Dag:
+    """Get a Dag instance for a Collections, reusing a previously built one.
+
+    Dag instances are cached by Collections instance, a new Dag is built when
+    the collections of the instance are replaced.
+
+    Args:
+        collections: Collections instance.
+
+    Returns:
+        Dag instance built from the Collections.
+    """
+    return _get_dag(_CollectionsKey(collections))
@@ -3,4 +3,4 @@
 
 from tdp.core.deployment.deployment_iterator import DeploymentIterator
 from tdp.core.deployment.deployment_runner import DeploymentRunner
-from tdp.core.deployment.executor import Executor
+from tdp.core.deployment.executor import AnsibleExecutor, Executor
@@ -4,14 +4,36 @@
 import io
 import logging
 import subprocess
-from typing import Iterable, Optional, Tuple
+from typing import Iterable, Optional, Protocol, Tuple
 
 from tdp.core.models import OperationStateEnum
 
 logger = logging.getLogger("tdp").getChild("ansible_executor")
 
 
-class Executor:
+class Executor(Protocol):
+    """Interface to execute an operation's playbook."""
+
+    def execute(
+        self,
+        playbook: str,
+        host: Optional[str] = None,
+        extra_vars: Optional[Iterable[str]] = None,
+    ) -> Tuple[OperationStateEnum, bytes]:
+        """Executes a playbook.
+
+        Args:
+            playbook: Name of the playbook to execute.
+            host: Host where the playbook must be ran.
+            extra_vars: Extra vars for the playbook.
+
+        Returns:
+            A tuple with the state of the command and the output of the command in UTF-8.
+        """
+        ...
+
+
+class AnsibleExecutor:
     """Allow to execute commands using Ansible."""
 
     def __init__(self, run_directory=None, dry: bool = False):
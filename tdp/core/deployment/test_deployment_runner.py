@@ -3,12 +3,12 @@
 
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING
 
 import pytest
 
 from tdp.core.deployment.deployment_runner import DeploymentRunner
-from tdp.core.deployment.executor import Executor
 from tdp.core.models import (
     DeploymentLog,
     DeploymentStateEnum,
@@ -22,9 +22,20 @@ if TYPE_CHECKING:
     from tdp.core.variables import ClusterVariables
 
 
-class MockExecutor(Executor):
+@functools.lru_cache(maxsize=64)
+def _encode_playbook(playbook) -> bytes:
+    return str(playbook).encode("utf-8")
+
+
+class MockExecutor:
+    _SUCCESS_SUFFIX = b" LOG SUCCESS"
+    _FAILURE_SUFFIX = b" LOG FAILURE"
+
     def execute(self, playbook, host=None, extra_vars=None):
-        return OperationStateEnum.SUCCESS, f"{playbook} LOG SUCCESS".encode("utf-8")
+        return (
+            OperationStateEnum.SUCCESS,
+            _encode_playbook(playbook) + self._SUCCESS_SUFFIX,
+        )
 
 
 class FailingExecutor(MockExecutor):
@@ -33,7 +44,10 @@ class FailingExecutor(MockExecutor):
 
     def execute(self, playbook, host=None, extra_vars=None):
         if self.count > 0:
-            return OperationStateEnum.FAILURE, f"{playbook} LOG FAILURE".encode("utf-8")
+            return (
+                OperationStateEnum.FAILURE,
+                _encode_playbook(playbook) + self._FAILURE_SUFFIX,
+            )
         self.count += 1
         return super().execute(playbook, host, extra_vars)
 
@@ -229,19 +243,18 @@ def test_deployment_dag_is_resumed(
     assert (
         resume_deployment_iterator.deployment_log.state == DeploymentStateEnum.SUCCESS
     )
-    failed_operation = next(
-        filter(
-            lambda x: x.state == DeploymentStateEnum.FAILURE,
-            deployment_iterator.deployment_log.operations,
-        )
+    FAILURE = DeploymentStateEnum.FAILURE
+    operations = deployment_iterator.deployment_log.operations
+    failed_operation_index, failed_operation = next(
+        (i, operation)
+        for i, operation in enumerate(operations)
+        if operation.state == FAILURE
     )
     assert (
         failed_operation.operation
         == resume_deployment_iterator.deployment_log.operations[0].operation
     )
-    assert len(
-        deployment_iterator.deployment_log.operations
-    ) - deployment_iterator.deployment_log.operations.index(failed_operation) == len(
+    assert len(operations) - failed_operation_index == len(
         resume_deployment_iterator.deployment_log.operations
     )
 
@@ -280,11 +293,11 @@ def test_deployment_reconfigure_is_resumed(
     assert (
         resume_deployment_iterator.deployment_log.state == DeploymentStateEnum.SUCCESS
     )
+    FAILURE = DeploymentStateEnum.FAILURE
     failed_operation = next(
-        filter(
-            lambda x: x.state == DeploymentStateEnum.FAILURE,
-            deployment_iterator.deployment_log.operations,
-        )
+        operation
+        for operation in deployment_iterator.deployment_log.operations
+        if operation.state == FAILURE
     )
     assert (
         failed_operation.operation
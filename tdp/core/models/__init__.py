@@ -1,8 +1,13 @@
 # Copyright 2022 TOSIT.IO
 # SPDX-License-Identifier: Apache-2.0
 
+from sqlalchemy import func, inspect, text
+
 from tdp.core.models.base import Base
-from tdp.core.models.component_version_log import ComponentVersionLog
+from tdp.core.models.component_version_log import (
+    SHORT_VERSION_LENGTH,
+    ComponentVersionLog,
+)
 from tdp.core.models.deployment_log import (
     DeploymentLog,
     DeploymentTypeEnum,
@@ -18,3 +23,40 @@ from tdp.core.models.state_enum import DeploymentStateEnum, OperationStateEnum
 
 def init_database(engine):
     Base.metadata.create_all(engine)
+    _add_component_version_log_short_version(engine)
+    _create_component_version_log_indexes(engine)
+
+
+def _add_component_version_log_short_version(engine):
+    """Add and backfill the short_version column of databases created without it.
+
+    Args:
+        engine: SQLAlchemy engine of the database.
+    """
+    table = ComponentVersionLog.__table__
+    columns = [column["name"] for column in inspect(engine).get_columns(table.name)]
+    if table.c.short_version.name in columns:
+        return
+    column_type = table.c.short_version.type.compile(engine.dialect)
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                f"ALTER TABLE {table.name} "
+                f"ADD COLUMN {table.c.short_version.name} {column_type}"
+            )
+        )
+        connection.execute(
+            table.update().values(
+                short_version=func.substr(table.c.version, 1, SHORT_VERSION_LENGTH)
+            )
+        )
+
+
+def _create_component_version_log_indexes(engine):
+    """Create the component_version_log indexes of databases created without them.
+
+    Args:
+        engine: SQLAlchemy engine of the database.
+    """
+    for index in ComponentVersionLog.__table__.indexes:
+        index.create(engine, checkfirst=True)
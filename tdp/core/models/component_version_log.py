@@ -5,8 +5,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import ForeignKey, String, UniqueConstraint
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import ForeignKey, Index, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from tdp.core.models.base import Base
 from tdp.core.operation import (
@@ -19,6 +19,8 @@ from tdp.core.repository.repository import VERSION_MAX_LENGTH
 if TYPE_CHECKING:
     from tdp.core.models.deployment_log import DeploymentLog
 
+SHORT_VERSION_LENGTH = 7
+
 
 class ComponentVersionLog(Base):
     """Hold what component version are deployed.
@@ -29,6 +31,7 @@ class ComponentVersionLog(Base):
         service: Service name.
         component: Component name.
         version: Component version.
+        short_version: Component version truncated, set along with the version.
     """
 
     __tablename__ = "component_version_log"
@@ -39,9 +42,22 @@ class ComponentVersionLog(Base):
     component: Mapped[Optional[str]] = mapped_column(String(COMPONENT_NAME_MAX_LENGTH))
     host: Mapped[Optional[str]] = mapped_column(String(HOST_NAME_MAX_LENGTH))
     version: Mapped[str] = mapped_column(String(VERSION_MAX_LENGTH))
+    short_version: Mapped[Optional[str]] = mapped_column(String(SHORT_VERSION_LENGTH))
 
     deployment: Mapped[DeploymentLog] = relationship(back_populates="component_version")
 
     __table_args__ = (
         UniqueConstraint("deployment_id", "service", "component", "host"),
+        # Covers the latest version lookup for each service/component pair
+        Index(
+            "ix_component_version_log_service_component_deployment_id",
+            "service",
+            "component",
+            "deployment_id",
+        ),
     )
+
+    @validates("version")
+    def _set_short_version(self, key: str, version: str) -> str:
+        self.short_version = version[:SHORT_VERSION_LENGTH] if version else version
+        return version
@@ -3,9 +3,12 @@
 
 from __future__ import annotations
 
+import fnmatch
+import functools
 import logging
+import re
 from datetime import datetime
-from typing import TYPE_CHECKING, Iterable, Optional
+from typing import TYPE_CHECKING, Iterable, Optional, Sequence
 
 from sqlalchemy import JSON, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -69,6 +72,22 @@ class FilterTypeEnum(BaseEnum):
     GLOB = "glob"
 
 
+@functools.lru_cache(maxsize=128)
+def _compile_filter(filter_expression: str, filter_type: FilterTypeEnum) -> re.Pattern:
+    """Compile a filter expression into a regex pattern.
+
+    Args:
+        filter_expression: Filter expression to compile.
+        filter_type: Filter type of the expression.
+
+    Returns:
+        Compiled pattern matching operation names.
+    """
+    if filter_type == FilterTypeEnum.REGEX:
+        return re.compile(filter_expression)
+    return re.compile(fnmatch.translate(filter_expression))
+
+
 class DeploymentLog(Base):
     """Deployment log model.
 
@@ -136,8 +155,8 @@ class DeploymentLog(Base):
     @staticmethod
     def from_dag(
         dag: Dag,
-        targets: Optional[list[str]] = None,
-        sources: Optional[list[str]] = None,
+        targets: Optional[Sequence[str]] = None,
+        sources: Optional[Sequence[str]] = None,
         filter_expression: Optional[str] = None,
         filter_type: Optional[FilterTypeEnum] = None,
         restart: bool = False,
@@ -146,8 +165,8 @@ class DeploymentLog(Base):
 
         Args:
             dag: DAG to generate the deployment plan from.
-            targets: List of targets to which to deploy.
-            sources: List of sources from which to deploy.
+            targets: Targets to which to deploy.
+            sources: Sources from which to deploy.
             filter_expression: Filter expression to apply on the DAG.
             filter_type: Filter type to apply on the DAG.
             restart: Whether or not to transform start operations to restart.
@@ -155,19 +174,22 @@ class DeploymentLog(Base):
         Raises:
             EmptyDeploymentPlanError: If the deployment plan is empty.
         """
-        operations = dag.get_operations(
-            sources=sources, targets=targets, restart=restart
-        )
+        # default behavior is glob
+        if filter_expression is not None and filter_type != FilterTypeEnum.REGEX:
+            filter_type = FilterTypeEnum.GLOB
 
-        if filter_expression is not None:
-            if filter_type == FilterTypeEnum.REGEX:
-                operations = dag.filter_operations_regex(operations, filter_expression)
-            else:
-                operations = dag.filter_operations_glob(operations, filter_expression)
-                # default behavior is glob
-                filter_type = FilterTypeEnum.GLOB
+        operation_names = dag.get_operations_names(
+            sources=tuple(sources) if sources else None,
+            targets=tuple(targets) if targets else None,
+            restart=restart,
+            filter_pattern=(
+                _compile_filter(filter_expression, filter_type)
+                if filter_expression is not None
+                else None
+            ),
+        )
 
-        if len(operations) == 0:
+        if len(operation_names) == 0:
             raise NoOperationMatchError(
                 "Combination of parameters resulted into an empty list of Operations (noop included)."
             )
@@ -175,8 +197,8 @@ class DeploymentLog(Base):
         deployment_log = DeploymentLog(
             deployment_type=DeploymentTypeEnum.DAG,
             state=DeploymentStateEnum.PLANNED,
-            targets=targets,
-            sources=sources,
+            targets=list(targets) if targets else None,
+            sources=list(sources) if sources else None,
             extra_vars=None,
             filter_expression=filter_expression,
             filter_type=filter_type,
@@ -184,13 +206,13 @@ class DeploymentLog(Base):
         )
         deployment_log.operations = [
             OperationLog(
-                operation=operation.name,
+                operation=operation_name,
                 operation_order=i,
                 host=None,
                 extra_vars=None,
                 state=OperationStateEnum.PLANNED,
             )
-            for i, operation in enumerate(operations, 1)
+            for i, operation_name in enumerate(operation_names, 1)
         ]
         return deployment_log
 
@@ -5,9 +5,10 @@ import logging
 from datetime import datetime, timedelta
 
 import pytest
-from sqlalchemy import Table, create_engine
+from sqlalchemy import Table, create_engine, inspect, text
 from sqlalchemy.orm import Session, sessionmaker
 
+from tdp.core.models import init_database
 from tdp.core.models.base import Base
 from tdp.core.models.component_version_log import ComponentVersionLog
 from tdp.core.models.deployment_log import DeploymentLog
@@ -99,6 +100,7 @@ def test_create_deployment_log(session_maker: sessionmaker[Session]):
         assert result.component_version[0].service == "service1"
         assert result.component_version[0].component == "component1"
         assert result.component_version[0].version == "1.0.0"
+        assert result.component_version[0].short_version == "1.0.0"
 
         assert len(result.operations) == 1
         assert result.operations[0].operation_order == 1
@@ -106,3 +108,84 @@ def test_create_deployment_log(session_maker: sessionmaker[Session]):
         assert result.operations[0].host == "host1"
         assert result.operations[0].state == "Success"
         assert result.operations[0].logs == b"operation log"
+
+
+def test_component_version_log_short_version(session_maker: sessionmaker[Session]):
+    deployment_log = DeploymentLog(state="Success", deployment_type="Dag")
+    deployment_log.component_version.append(
+        ComponentVersionLog(
+            service="service1",
+            version="0123456789abcdef0123456789abcdef01234567",
+        )
+    )
+
+    with session_maker() as session:
+        session.add(deployment_log)
+        session.commit()
+
+        result = session.get(DeploymentLog, deployment_log.id)
+
+        assert result.component_version[0].short_version == "0123456"
+
+
+def _create_legacy_database():
+    """Create a database with the schema of component_version_log before short_version."""
+    engine = create_engine("sqlite+pysqlite:///:memory:", future=True)
+    Base.metadata.create_all(
+        engine,
+        tables=[
+            table
+            for table in Base.metadata.sorted_tables
+            if table.name != ComponentVersionLog.__tablename__
+        ],
+    )
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "CREATE TABLE component_version_log ("
+                "id INTEGER NOT NULL PRIMARY KEY, "
+                "deployment_id INTEGER NOT NULL REFERENCES deployment_log (id), "
+                "service VARCHAR(20) NOT NULL, "
+                "component VARCHAR(30), "
+                "host VARCHAR(255), "
+                "version VARCHAR(40) NOT NULL, "
+                "UNIQUE (deployment_id, service, component, host))"
+            )
+        )
+        connection.execute(text("INSERT INTO deployment_log (id) VALUES (1)"))
+        connection.execute(
+            text(
+                "INSERT INTO component_version_log (deployment_id, service, version) "
+                "VALUES (1, 'service1', '0123456789abcdef0123456789abcdef01234567')"
+            )
+        )
+
+    return engine
+
+
+def test_init_database_backfills_short_version():
+    engine = _create_legacy_database()
+
+    init_database(engine)
+    # Running it again on an up to date database is a no-op
+    init_database(engine)
+
+    with sessionmaker(bind=engine)() as session:
+        result = session.get(DeploymentLog, 1)
+
+        assert result.component_version[0].short_version == "0123456"
+    engine.dispose()
+
+
+def test_init_database_creates_component_version_log_index():
+    engine = _create_legacy_database()
+
+    init_database(engine)
+    # Running it again on an up to date database is a no-op
+    init_database(engine)
+
+    indexes = [
+        index["name"] for index in inspect(engine).get_indexes("component_version_log")
+    ]
+    assert "ix_component_version_log_service_component_deployment_id" in indexes
+    engine.dispose()
@@ -20,6 +20,11 @@ class TestBaseEnum:
         assert "value1" in SampleEnum
         assert "value4" not in SampleEnum
 
+    def test_base_enum_contains_member(self):
+        """Test BaseEnum.__contains__ with members and unhashable values."""
+        assert SampleEnum.VALUE1 in SampleEnum
+        assert ["value1"] not in SampleEnum
+
     def test_base_enum_equals(self):
         """Test BaseEnum.__eq__."""
         assert SampleEnum.VALUE1 == SampleEnum("value1")
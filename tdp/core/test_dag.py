@@ -0,0 +1,73 @@
+# Copyright 2022 TOSIT.IO
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from tdp.conftest import generate_collection
+from tdp.core.collection import Collection
+from tdp.core.collections import Collections
+from tdp.core.dag import Dag, get_dag
+
+
+def test_dag_operations_names_are_reset_with_operations(
+    minimal_collections: Collections,
+):
+    dag = Dag(minimal_collections)
+    assert len(dag.get_operations_names(targets=("mock_init",))) == 8
+
+    dag.operations = {
+        "mock_node_install": minimal_collections.dag_operations["mock_node_install"]
+    }
+
+    assert dag.get_operations_names() == ("mock_node_install",)
+
+
+def test_get_dag_is_rebuilt_when_collections_are_replaced(
+    tmp_path_factory: pytest.TempPathFactory,
+):
+    collection_path = tmp_path_factory.mktemp("collection")
+    generate_collection(
+        collection_path,
+        {"service": [{"name": "service_install", "depends_on": []}]},
+        {"service": {"service": {}}},
+    )
+    collections = Collections.from_collection_list(
+        [Collection.from_path(collection_path)]
+    )
+
+    dag = get_dag(collections)
+    assert get_dag(collections) is dag
+    assert "service_config" not in dag.operations
+
+    (collection_path / "tdp_lib_dag" / "service.yml").write_text(
+        "- name: service_install\n"
+        "- name: service_config\n"
+        "  depends_on: [service_install]\n"
+    )
+    (collection_path / "playbooks" / "service_config.yml").write_text(
+        "- hosts: localhost\n"
+    )
+    collection = Collection.from_path(collection_path)
+    collections.collections = {collection.name: collection}
+
+    assert "service_config" in collections.dag_operations
+    assert get_dag(collections) is not dag
+    assert "service_config" in get_dag(collections).operations
+
+
+def test_get_dag_is_not_shared_between_collections(
+    tmp_path_factory: pytest.TempPathFactory,
+):
+    collection_path = tmp_path_factory.mktemp("collection")
+    generate_collection(
+        collection_path,
+        {"service": [{"name": "service_install", "depends_on": []}]},
+        {"service": {"service": {}}},
+    )
+    collection = Collection.from_path(collection_path)
+    collections_1 = Collections.from_collection_list([collection])
+    collections_2 = Collections.from_collection_list([collection])
+
+    assert get_dag(collections_1) is get_dag(collections_1)
+    assert get_dag(collections_1) is not get_dag(collections_2)
+    assert get_dag(collections_2).collections is collections_2
@@ -19,10 +19,9 @@ class _MetaEnum(EnumMeta):
             True if value is a valid Enum value, False otherwise.
         """
         try:
-            cls(item)
-        except ValueError:
+            return item in cls._value2member_map_
+        except TypeError:
             return False
-        return True
 
 
 class BaseEnum(str, Enum, metaclass=_MetaEnum):